@@ -3,16 +3,13 @@
 # a 2d pose visualiztion on the input image as well as a list of 3D pose visualizations.
 # Modifications and enhancements by: Navid Salami Pargoo.
 
+import colorsys
 import math
 from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import mmcv
 import numpy as np
-import matplotlib
-matplotlib.use('Agg') 
-from matplotlib import pyplot as plt
-plt.ioff()
 from mmengine.dist import master_only
 from mmengine.structures import InstanceData
 
@@ -21,7 +18,92 @@ from mmpose.registry import VISUALIZERS
 from mmpose.structures import PoseDataSample
 from . import PoseLocalVisualizer
 
-import colorsys
+
+# corners and edges of a unit cube centered at the origin, drawn as the
+# bounding box of the 3d pose panels
+_CUBE_CORNERS = np.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5)
+                          for z in (-0.5, 0.5)])
+_CUBE_EDGES = [(i, j) for i in range(8) for j in range(i + 1, 8)
+               if bin(i ^ j).count('1') == 1]
+
+
+def _get_track_color(idx: int) -> Tuple[int, int, int]:
+    """Get a distinct RGB color for a track id by stepping the hue with the
+    golden ratio."""
+    golden_ratio_conjugate = 0.618033988749895
+    h = (idx * golden_ratio_conjugate) % 1.0
+    s = 0.4 + (idx % 5) * 0.1
+    l = 0.4 + (idx % 3) * 0.1
+    return tuple(int(c * 255) for c in colorsys.hls_to_rgb(h, l, s))
+
+
+# colors of the most common (small) track ids
+_TRACK_COLOR_LUT = [_get_track_color(idx) for idx in range(256)]
+
+
+def _to_color_tuples(colors: list) -> list:
+    """Convert a list of colors to integer tuples that can be passed to
+    OpenCV. Color names are converted with ``mmcv.color_val`` and ``None``
+    entries (elements that should not be drawn) are kept."""
+    return [
+        None if c is None else
+        mmcv.color_val(c)[::-1] if isinstance(c, str) else tuple(
+            int(v) for v in c) for c in colors
+    ]
+
+
+def _get_view_rotation(elev: float, azim: float) -> np.ndarray:
+    """Get the rotation from world coordinates to view coordinates (right,
+    up, towards the viewer), following the camera convention of matplotlib
+    3d axes.
+
+    Args:
+        elev (float): The elevation view angle in degrees.
+        azim (float): The azimuth angle in degrees.
+
+    Returns:
+        np.ndarray: The rotation matrix with the shape of (3, 3).
+    """
+    elev, azim = np.deg2rad(elev), np.deg2rad(azim)
+    return np.array(
+        [[-np.sin(azim), np.cos(azim), 0],
+         [
+             -np.sin(elev) * np.cos(azim), -np.sin(elev) * np.sin(azim),
+             np.cos(elev)
+         ],
+         [
+             np.cos(elev) * np.cos(azim),
+             np.cos(elev) * np.sin(azim),
+             np.sin(elev)
+         ]],
+        dtype=np.float32)
+
+
+def _project_points(points: np.ndarray, view_rot: np.ndarray, scale: float,
+                    origin: np.ndarray) -> Tuple[List, np.ndarray]:
+    """Project 3d points, relative to the center of the view, to the pixel
+    coordinates of a panel with an orthographic projection.
+
+    Args:
+        points (np.ndarray): The 3d points with the shape of (N, 3).
+        view_rot (np.ndarray): The rotation from world coordinates to view
+            coordinates with the shape of (3, 3).
+        scale (float): The number of pixels per unit length.
+        origin (np.ndarray): The pixel coordinates of the center of the view.
+
+    Returns:
+        tuple:
+        - list: the pixel coordinates of the points as ``(x, y)`` tuples.
+        - np.ndarray: the depth of the points, larger is closer to the
+            viewer.
+    """
+    view = points @ view_rot.T
+    pixels = np.empty((len(points), 2))
+    pixels[:, 0] = origin[0] + view[:, 0] * scale
+    pixels[:, 1] = origin[1] - view[:, 1] * scale
+    pixels = [tuple(p) for p in np.round(pixels).astype(np.int32).tolist()]
+    return pixels, view[:, 2]
+
 
 @VISUALIZERS.register_module()
 class Pose3dLocalVisualizer(PoseLocalVisualizer):
@@ -83,6 +165,120 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
         self.det_dataset_skeleton = det_dataset_skeleton
         self.det_dataset_link_color = det_dataset_link_color
 
+        # the empty and "NO DATA" panels of the last plot settings
+        self._blank_panel_cache: Dict[tuple, np.ndarray] = {}
+        self._dummy_cache: Dict[tuple, np.ndarray] = {}
+        # see ``_get_kpt_colors``, ``_get_links`` and
+        # ``_get_kpt_convert_matrix``
+        self._kpt_color_cache: Dict[tuple, tuple] = {}
+        self._link_cache: Dict[bool, tuple] = {}
+        self._kpt_convert_cache: Dict[tuple, np.ndarray] = {}
+
+    def _get_kpt_colors(self, num_kpts: int, det: bool = False) -> tuple:
+        """Get the color of each keypoint, as an integer tuple, and whether it
+        is drawn. The colors are resolved once per number of keypoints and
+        resolved again whenever ``kpt_color`` or ``det_kpt_color`` is
+        reassigned.
+
+        Args:
+            num_kpts (int): The number of keypoints of an instance.
+            det (bool): Whether to get the colors of the 2d detection drawn
+                on the image. Otherwise the colors of the 3d panels are
+                returned. Defaults to ``False``
+
+        Returns:
+            tuple:
+            - list: the color of each keypoint, ``None`` if it is hidden.
+            - np.ndarray: whether each keypoint is drawn.
+        """
+        kpt_color = self.kpt_color
+        if det and self.det_kpt_color is not None:
+            kpt_color = self.det_kpt_color
+
+        key = (num_kpts, det)
+        cached = self._kpt_color_cache.get(key)
+        if cached is not None and cached[0] is kpt_color:
+            return cached[1]
+
+        src = kpt_color
+        if kpt_color is None or isinstance(kpt_color, str):
+            kpt_color = [kpt_color] * num_kpts
+        elif len(kpt_color) != num_kpts:
+            raise ValueError(f'the length of kpt_color '
+                             f'({len(kpt_color)}) does not matches '
+                             f'that of keypoints ({num_kpts})')
+        kpt_color = _to_color_tuples(kpt_color)
+        kpt_shown = np.array([c is not None for c in kpt_color], dtype=bool)
+        self._kpt_color_cache[key] = (src, (kpt_color, kpt_shown))
+        return kpt_color, kpt_shown
+
+    def _get_links(self, det: bool = False) -> Optional[tuple]:
+        """Get the skeleton, the color of each link, as an integer tuple, and
+        whether it is drawn. They are resolved once and resolved again
+        whenever the skeleton or the link colors are reassigned.
+
+        Args:
+            det (bool): Whether to get the links of the 2d detection drawn on
+                the image. Otherwise the links of the 3d panels are returned.
+                Defaults to ``False``
+
+        Returns:
+            tuple, optional: the skeleton as an array with the shape of
+            (L, 2), the color of each link (``None`` if it is hidden) and
+            whether each link is drawn. ``None`` if no link is drawn.
+        """
+        skeleton = self.skeleton
+        link_color = self.link_color
+        if det and self.det_dataset_skeleton is not None:
+            skeleton = self.det_dataset_skeleton
+        if det and self.det_dataset_link_color is not None:
+            link_color = self.det_dataset_link_color
+
+        cached = self._link_cache.get(det)
+        if cached is not None and cached[0] is skeleton \
+                and cached[1] is link_color:
+            return cached[2]
+
+        links = None
+        if skeleton is not None and link_color is not None:
+            sk_arr = np.asarray(skeleton, dtype=np.int64).reshape(-1, 2)
+            colors = link_color
+            if isinstance(colors, str):
+                colors = [colors] * len(sk_arr)
+            elif len(colors) != len(sk_arr):
+                raise ValueError(f'the length of link_color '
+                                 f'({len(colors)}) does not matches '
+                                 f'that of skeleton ({len(sk_arr)})')
+            colors = _to_color_tuples(colors)
+            link_shown = np.array([c is not None for c in colors], dtype=bool)
+            links = (sk_arr, colors, link_shown)
+        self._link_cache[det] = (skeleton, link_color, links)
+        return links
+
+    def _get_kpt_convert_matrix(self, num_kpts: int, dataset_2d: str,
+                                dataset_3d: str) -> np.ndarray:
+        """Get the matrix that converts per-keypoint values from the keypoint
+        definition of ``dataset_2d`` to that of ``dataset_3d``.
+
+        ``convert_keypoint_definition`` only selects and averages keypoints,
+        so the conversion is linear and is recovered once per dataset pair by
+        converting an identity matrix.
+
+        Args:
+            num_kpts (int): The number of keypoints of ``dataset_2d``.
+            dataset_2d (str): Name of 2d keypoint dataset.
+            dataset_3d (str): Name of 3d keypoint dataset.
+
+        Returns:
+            np.ndarray: The conversion matrix with the shape of (K', K).
+        """
+        key = (num_kpts, dataset_2d, dataset_3d)
+        if key not in self._kpt_convert_cache:
+            eye = np.eye(num_kpts, dtype=np.float32)[None]
+            self._kpt_convert_cache[key] = convert_keypoint_definition(
+                eye, dataset_2d, dataset_3d)[0]
+        return self._kpt_convert_cache[key]
+
     def _draw_3d_data_samples(self,
                               pose_samples: PoseDataSample,
                               track_ids: List[int] = [],
@@ -108,21 +304,25 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                 of num_instances.
             plot_size (int): The size of the plot. Defaults to 300.
             axis_azimuth (float): axis azimuth angle for 3D visualizations.
-            axis_dist (float): axis distance for 3D visualizations.
+            axis_dist (float): axis distance for 3D visualizations. The
+                poses are zoomed by ``10 / axis_dist``.
             axis_elev (float): axis elevation view angle for 3D visualizations.
             axis_limit (float): The axis limit to visualize 3d pose. The xyz
                 range will be set as:
                 - x: [x_c - axis_limit/2, x_c + axis_limit/2]
                 - y: [y_c - axis_limit/2, y_c + axis_limit/2]
-                - z: [0, axis_limit]
-                Where x_c, y_c is the mean value of x and y coordinates
+                - z: [z_c - axis_limit/2, z_c + axis_limit/2]
+                Where x_c, y_c, z_c is the mean value of x, y and z
+                coordinates
             show_kpt_idx (bool): Whether to show the index of keypoints.
                 Defaults to ``False``
             scores_2d (np.ndarray, optional): Keypoint scores of 2d estimation
                 that will be used to filter 3d instances.
 
         Returns:
-            List[np.ndarray]: the list of drawn 3d pose estimations.
+            Dict[int, np.ndarray]: the drawn 3d pose estimations, keyed by
+            track id. The "NO DATA" plots padding the result to
+            ``num_instances`` are keyed by negative ids from -2 on.
         """
         pose3d_data_dic = {}  # Dictionary to store individual subplots
         need_dummy_plot = False # if len(pred_instances) is less than num_instances
@@ -147,6 +347,48 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
             else:
                 need_dummy_plot = True
 
+        # the 3d poses are drawn with an orthographic projection of the view
+        # that matplotlib 3d axes would show, on top of a bounding cube
+        view_rot = _get_view_rotation(axis_elev, axis_azimuth)
+        title_h = int(round(plot_size * 0.15))
+        origin = np.array([plot_size / 2, (plot_size + title_h) / 2])
+        scale = (plot_size - title_h) / (axis_limit * math.sqrt(3)) \
+            * 10.0 / axis_dist
+
+        # the projected cube does not depend on the pose center nor on
+        # axis_limit, so the empty panel is drawn once per plot settings. Only
+        # the last settings are kept, as a rotating view changes them on
+        # every frame
+        panel_key = (plot_size, axis_elev, axis_azimuth, axis_dist)
+
+        def _new_panel():
+            if panel_key not in self._blank_panel_cache:
+                self._blank_panel_cache.clear()
+                panel = np.full((plot_size, plot_size, 3),
+                                255,
+                                dtype=np.uint8)
+                corners, _ = _project_points(_CUBE_CORNERS * axis_limit,
+                                             view_rot, scale, origin)
+                for i, j in _CUBE_EDGES:
+                    cv2.line(panel, corners[i], corners[j], (200, 200, 200),
+                             1, cv2.LINE_AA)
+                panel.setflags(write=False)
+                self._blank_panel_cache[panel_key] = panel
+            return self._blank_panel_cache[panel_key].copy()
+
+        def _draw_title(panel, text, text_color, bg_color=None):
+            font_scale = plot_size / 375
+            (text_w, text_h), baseline = cv2.getTextSize(
+                text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)
+            x = max(0, (plot_size - text_w) // 2)
+            y = (title_h + text_h) // 2
+            if bg_color is not None:
+                cv2.rectangle(panel, (x - 4, y - text_h - 4),
+                              (x + text_w + 4, y + baseline), bg_color,
+                              cv2.FILLED)
+            cv2.putText(panel, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX,
+                        font_scale, text_color, 2, cv2.LINE_AA)
+
         def _draw_3d_instances_kpts(keypoints,
                                     scores,
                                     scores_2d,
@@ -156,109 +398,62 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                                     show_kpt_idx,
                                     title=None):
 
-            def get_color(idx):
-                golden_ratio_conjugate = 0.618033988749895
-                h = (idx * golden_ratio_conjugate) % 1.0
-                s = 0.4 + (idx % 5) * 0.1
-                l = 0.4 + (idx % 3) * 0.1
-                r, g, b = colorsys.hls_to_rgb(h, l, s)
-                return [r, g, b]
+            # skip the instances with low mean scores, and center the view
+            # of the others on their mean keypoint, for all instances at once
+            num_valid = min(len(keypoints), len(scores), len(scores_2d))
+            skip_mask = (np.mean(scores[:num_valid], axis=1) < kpt_thr) | (
+                np.mean(scores_2d[:num_valid], axis=1) < kpt_thr)
+            centers = np.mean(keypoints[:num_valid, :, :3], axis=1)
 
             for idx, (kpts, score, score_2d) in enumerate(zip(keypoints, scores, scores_2d)):
-                skip = False
                 if track_ids[idx] == -1:
                     continue
-                # valid = np.logical_and(score >= kpt_thr, score_2d >= kpt_thr,
-                #                        np.any(~np.isnan(kpts), axis=-1))
-                # kpts_valid = kpts[valid]
-                kpts_valid = kpts
-
-                if np.mean(score) < kpt_thr or np.mean(score_2d) < kpt_thr:
-                    skip = True
-
-                # Create a new figure for each instance
-                fig = plt.figure(
-                    figsize=(plot_size/100, plot_size/100), 
-                    dpi=100
-                    )
-                ax = fig.add_subplot(111, projection='3d')
-                ax.view_init(elev=axis_elev, azim=axis_azimuth)
-                ax.set_aspect('auto')
-                ax.set_xticks([])
-                ax.set_yticks([])
-                ax.set_zticks([])
-                ax.set_xticklabels([])
-                ax.set_yticklabels([])
-                ax.set_zticklabels([])
+                skip = skip_mask[idx]
 
+                pred_img_data = _new_panel()
                 if title:
-                    ax.set_title(f'{title} ({track_ids[idx]})', color='white', backgroundcolor=get_color(track_ids[idx]))
-                    ax.title.set_fontweight('bold')
-                    ax.title.set_fontsize(20)
-                ax.dist = axis_dist
-
-                if skip:
-                    fig.tight_layout()
-                    fig.canvas.draw()
-                else:                    
-                    # x_c = np.mean(kpts_valid[:, 0]) if valid.any() else 0
-                    # y_c = np.mean(kpts_valid[:, 1]) if valid.any() else 0
-                    # z_c = np.mean(kpts_valid[:, 2]) if valid.any() else 0
-                    x_c = np.mean(kpts_valid[:, 0])
-                    y_c = np.mean(kpts_valid[:, 1])
-                    z_c = np.mean(kpts_valid[:, 2])
-
-                    ax.set_xlim3d([x_c - axis_limit / 2, x_c + axis_limit / 2])
-                    ax.set_ylim3d([y_c - axis_limit / 2, y_c + axis_limit / 2])
-                    ax.set_zlim3d([min(0, z_c - axis_limit / 2), z_c + axis_limit / 2])
-
-                    if self.kpt_color is None or isinstance(self.kpt_color, str):
-                        kpt_color = [self.kpt_color] * len(kpts)
-                    elif len(self.kpt_color) == len(kpts):
-                        kpt_color = self.kpt_color
+                    track_id = track_ids[idx]
+                    if 0 <= track_id < len(_TRACK_COLOR_LUT):
+                        bg_color = _TRACK_COLOR_LUT[track_id]
                     else:
-                        raise ValueError(f'the length of kpt_color ({len(self.kpt_color)}) does not matches that of keypoints ({len(kpts)})')
-
-                    x_3d, y_3d, z_3d = np.split(kpts_valid[:, :3], [1, 2], axis=1)
-                    # kpt_color = kpt_color[valid] / 255.
-                    kpt_color = kpt_color / 255.
-                    ax.scatter(x_3d, y_3d, z_3d, marker='o', c=kpt_color)
+                        bg_color = _get_track_color(track_id)
+                    _draw_title(pred_img_data, f'{title} ({track_ids[idx]})',
+                                (255, 255, 255), bg_color)
+
+                if not skip:
+                    kpt_color, kpt_shown = self._get_kpt_colors(len(kpts))
+
+                    pts, depth = _project_points(kpts[:, :3] - centers[idx],
+                                                 view_rot, scale, origin)
+
+                    links = self._get_links()
+                    if links is not None:
+                        sk_arr, link_color, link_shown = links
+                        # a link is drawn only if both of its keypoints pass
+                        # the threshold in 3d and in 2d, from far to near
+                        link_ids = np.flatnonzero(
+                            link_shown
+                            & (score[sk_arr].min(axis=1) > kpt_thr)
+                            & (score_2d[sk_arr].min(axis=1) > kpt_thr))
+                        link_ids = link_ids[np.argsort(
+                            depth[sk_arr[link_ids]].mean(axis=1))]
+                        for sk_id in link_ids:
+                            cv2.line(pred_img_data, pts[sk_arr[sk_id, 0]],
+                                     pts[sk_arr[sk_id, 1]], link_color[sk_id],
+                                     max(1, int(self.line_width)),
+                                     cv2.LINE_AA)
+
+                    kpt_ids = np.flatnonzero(kpt_shown)
+                    for kid in kpt_ids[np.argsort(depth[kpt_ids])]:
+                        cv2.circle(pred_img_data, pts[kid], int(self.radius),
+                                   kpt_color[kid], -1, cv2.LINE_AA)
 
                     if show_kpt_idx:
-                        for kpt_idx in range(len(x_3d)):
-                            ax.text(x_3d[kpt_idx][0], y_3d[kpt_idx][0],
-                                    z_3d[kpt_idx][0], str(kpt_idx))
-
-                    if self.skeleton is not None and self.link_color is not None:
-                        if self.link_color is None or isinstance(self.link_color, str):
-                            link_color = [self.link_color] * len(self.skeleton)
-                        elif len(self.link_color) == len(self.skeleton):
-                            link_color = self.link_color
-                        else:
-                            raise ValueError(f'the length of link_color ({len(self.link_color)}) does not matches that of skeleton ({len(self.skeleton)})')
-
-                        for sk_id, sk in enumerate(self.skeleton):
-                            sk_indices = [_i for _i in sk]
-                            xs_3d = kpts[sk_indices, 0]
-                            ys_3d = kpts[sk_indices, 1]
-                            zs_3d = kpts[sk_indices, 2]
-                            kpt_score = score[sk_indices]
-                            kpt_score_2d = score_2d[sk_indices]
-                            if kpt_score.min() > kpt_thr and kpt_score_2d.min() > kpt_thr:
-                                _color = link_color[sk_id] / 255.
-                                ax.plot(xs_3d, ys_3d, zs_3d, color=_color, zdir='z')
-
-                    fig.tight_layout()
-                    fig.canvas.draw()
-
-                # Convert the figure to a numpy array
-                pred_img_data = np.frombuffer(fig.canvas.tostring_rgb(), dtype=np.uint8)
-                if not pred_img_data.any():
-                    pred_img_data = np.full((plot_size, plot_size, 3), 255)
-                else:
-                    pred_img_data = pred_img_data.reshape(plot_size, plot_size, 3)
-
-                plt.close(fig)
+                        for kpt_idx, pt in enumerate(pts):
+                            cv2.putText(pred_img_data, str(kpt_idx),
+                                        (pt[0] + int(self.radius), pt[1]),
+                                        cv2.FONT_HERSHEY_SIMPLEX, 0.4,
+                                        (0, 0, 0), 1, cv2.LINE_AA)
 
                 # append to the pose3d_data_dic
                 pose3d_data_dic[track_ids[idx]] = pred_img_data
@@ -282,30 +477,18 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                                     keypoints_visible, track_ids, 1, show_kpt_idx,
                                     'Track id')
 
-        if need_dummy_plot:  
+        if need_dummy_plot:
             num_dummy_plots = num_instances - len(pose3d_data_dic)
+            if num_dummy_plots > 0 and panel_key not in self._dummy_cache:
+                self._dummy_cache.clear()
+                pred_img_data = _new_panel()
+                _draw_title(pred_img_data, 'NO DATA', (128, 128, 128))
+                pred_img_data.setflags(write=False)
+                self._dummy_cache[panel_key] = pred_img_data
             for i in range(num_dummy_plots):
-                fig = plt.figure(figsize=(plot_size/100, plot_size/100), dpi=100)
-                ax = fig.add_subplot(111, projection='3d')
-                ax.view_init(elev=axis_elev, azim=axis_azimuth)
-                ax.set_aspect('auto')
-                ax.set_xticks([])
-                ax.set_yticks([])
-                ax.set_zticks([])
-                ax.set_xticklabels([])
-                ax.set_yticklabels([])
-                ax.set_zticklabels([])
-                ax.set_title('NO DATA', color='white')
-                ax.title.set_fontsize(20)
-                fig.tight_layout()
-                fig.canvas.draw()
-                pred_img_data = np.frombuffer(fig.canvas.tostring_rgb(), dtype=np.uint8)
-                if not pred_img_data.any():
-                    pred_img_data = np.full((plot_size, plot_size, 3), 255)
-                else:
-                    pred_img_data = pred_img_data.reshape(plot_size, plot_size, 3)
-                plt.close(fig)
-                pose3d_data_dic[-1 * (i + 2)] = pred_img_data
+                # copied so that the returned plots can be drawn on
+                pose3d_data_dic[-1 * (i + 2)] = \
+                    self._dummy_cache[panel_key].copy()
 
         return pose3d_data_dic 
 
@@ -378,9 +561,7 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                 keypoints, scores, keypoints_visible = keypoints_info[
                     ..., :2], keypoints_info[..., 2], keypoints_info[..., 3]
 
-            kpt_color = self.kpt_color
-            if self.det_kpt_color is not None:
-                kpt_color = self.det_kpt_color
+            links = self._get_links(det=True)
 
             for idx, (kpts, score, visible) in enumerate(zip(keypoints, scores,
                                             keypoints_visible)):
@@ -388,88 +569,61 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                     continue
 
                 kpts = np.array(kpts[..., :2], copy=False)
-
-                if kpt_color is None or isinstance(kpt_color, str):
-                    kpt_color = [kpt_color] * len(kpts)
-                elif len(kpt_color) == len(kpts):
-                    kpt_color = kpt_color
-                else:
-                    raise ValueError(f'the length of kpt_color '
-                                     f'({len(kpt_color)}) does not matches '
-                                     f'that of keypoints ({len(kpts)})')
-
-                # draw each point on image
-                for kid, kpt in enumerate(kpts):
-                    if score[kid] < kpt_thr or not visible[
-                            kid] or kpt_color[kid] is None:
-                        # skip the point that should not be drawn
-                        continue
-
-                    color = kpt_color[kid]
-                    if not isinstance(color, str):
-                        color = tuple(int(c) for c in color)
-                    transparency = self.alpha
-                    if self.show_keypoint_weight:
-                        transparency *= max(0, min(1, score[kid]))
+                kpt_color, kpt_shown = self._get_kpt_colors(
+                    len(kpts), det=True)
+
+                # draw all the valid points of the instance at once
+                kids = np.flatnonzero((score >= kpt_thr)
+                                      & visible.astype(bool) & kpt_shown)
+                colors = [kpt_color[kid] for kid in kids]
+                if self.show_keypoint_weight:
+                    # the transparency differs between points
+                    for kid, color in zip(kids, colors):
+                        self.draw_circles(
+                            kpts[kid],
+                            radius=np.array([self.radius]),
+                            face_colors=color,
+                            edge_colors=color,
+                            alpha=self.alpha * max(0, min(1, score[kid])),
+                            line_widths=self.radius)
+                elif len(kids) > 0:
                     self.draw_circles(
-                        kpt,
-                        radius=np.array([self.radius]),
-                        face_colors=color,
-                        edge_colors=color,
-                        alpha=transparency,
+                        kpts[kids],
+                        radius=np.full(len(kids), self.radius),
+                        face_colors=colors,
+                        edge_colors=colors,
+                        alpha=self.alpha,
                         line_widths=self.radius)
-                    if show_kpt_idx:
+                if show_kpt_idx:
+                    for kid, color in zip(kids, colors):
                         self.draw_texts(
                             str(kid),
-                            kpt,
+                            kpts[kid],
                             colors=color,
                             font_sizes=self.radius * 3,
                             vertical_alignments='bottom',
                             horizontal_alignments='center')
 
                 # draw links
-                skeleton = self.skeleton
-                if self.det_dataset_skeleton is not None:
-                    skeleton = self.det_dataset_skeleton
-                link_color = self.link_color
-                if self.det_dataset_link_color is not None:
-                    link_color = self.det_dataset_link_color
-                if skeleton is not None and link_color is not None:
-                    if link_color is None or isinstance(link_color, str):
-                        link_color = [link_color] * len(skeleton)
-                    elif len(link_color) == len(skeleton):
-                        link_color = link_color
-                    else:
-                        raise ValueError(
-                            f'the length of link_color '
-                            f'({len(link_color)}) does not matches '
-                            f'that of skeleton ({len(skeleton)})')
-
-                    for sk_id, sk in enumerate(skeleton):
-                        pos1 = (int(kpts[sk[0], 0]), int(kpts[sk[0], 1]))
-                        pos2 = (int(kpts[sk[1], 0]), int(kpts[sk[1], 1]))
-                        if not (visible[sk[0]] and visible[sk[1]]):
-                            continue
-
-                        if (pos1[0] <= 0 or pos1[0] >= img_w or pos1[1] <= 0
-                                or pos1[1] >= img_h or pos2[0] <= 0
-                                or pos2[0] >= img_w or pos2[1] <= 0
-                                or pos2[1] >= img_h or score[sk[0]] < kpt_thr
-                                or score[sk[1]] < kpt_thr
-                                or link_color[sk_id] is None):
-                            # skip the link that should not be drawn
-                            continue
-                        X = np.array((pos1[0], pos2[0]))
-                        Y = np.array((pos1[1], pos2[1]))
-                        color = link_color[sk_id]
-                        if not isinstance(color, str):
-                            color = tuple(int(c) for c in color)
-                        transparency = self.alpha
-                        if self.show_keypoint_weight:
-                            transparency *= max(
-                                0, min(1, 0.5 * (score[sk[0]] + score[sk[1]])))
-
-                        if skeleton_style == 'openpose':
+                if links is not None:
+                    sk_arr, link_color, link_shown = links
+                    pos = kpts[sk_arr].astype(np.int64)
+                    in_image = (pos > 0) & (pos < np.array([img_w, img_h]))
+                    link_ids = np.flatnonzero(
+                        link_shown & in_image.all(axis=(1, 2))
+                        & visible[sk_arr].astype(bool).all(axis=1)
+                        & (score[sk_arr] >= kpt_thr).all(axis=1))
+                    colors = [link_color[sk_id] for sk_id in link_ids]
+
+                    if skeleton_style == 'openpose':
+                        for sk_id, color in zip(link_ids, colors):
+                            X = pos[sk_id, :, 0]
+                            Y = pos[sk_id, :, 1]
+                            transparency = self.alpha
+                            if self.show_keypoint_weight:
+                                transparency *= max(
+                                    0,
+                                    min(1, 0.5 * score[sk_arr[sk_id]].sum()))
                             mX = np.mean(X)
                             mY = np.mean(Y)
                             length = ((Y[0] - Y[1])**2 + (X[0] - X[1])**2)**0.5
@@ -487,9 +641,12 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                                 face_colors=color,
                                 alpha=transparency)
 
-                        else:
-                            self.draw_lines(
-                                X, Y, color, line_widths=self.line_width)
+                    elif len(link_ids) > 0:
+                        self.draw_lines(
+                            pos[link_ids, :, 0],
+                            pos[link_ids, :, 1],
+                            colors,
+                            line_widths=self.line_width)
 
         return self.get_image(), scores
 
@@ -545,14 +702,16 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
             convert_keypoint (bool): Whether to convert keypoint definition.
                 Defaults to ``True``
             axis_azimuth (float): axis azimuth angle for 3D visualizations.
-            axis_dist (float): axis distance for 3D visualizations.
+            axis_dist (float): axis distance for 3D visualizations. The
+                poses are zoomed by ``10 / axis_dist``.
             axis_elev (float): axis elevation view angle for 3D visualizations.
             axis_limit (float): The axis limit to visualize 3d pose. The xyz
                 range will be set as:
                 - x: [x_c - axis_limit/2, x_c + axis_limit/2]
                 - y: [y_c - axis_limit/2, y_c + axis_limit/2]
-                - z: [0, axis_limit]
-                Where x_c, y_c is the mean value of x and y coordinates
+                - z: [z_c - axis_limit/2, z_c + axis_limit/2]
+                Where x_c, y_c, z_c is the mean value of x, y and z
+                coordinates
             num_instances (int): Number of instances to be shown in 3D. If
                 smaller than 0, all the instances in the pose_result will be
                 shown. Otherwise, pad or truncate the pose_result to a length
@@ -566,7 +725,9 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
         scores_2d = None
 
         if draw_2d:
-            pose_2d_data = image.copy()
+            # ``set_image`` draws on its own copy of the image, so the input
+            # image is never modified and does not need to be copied here
+            pose_2d_data = image
 
             # draw bboxes & keypoints
             if (det_data_sample is not None
@@ -582,11 +743,10 @@ class Pose3dLocalVisualizer(PoseLocalVisualizer):
                     pose_2d_data = self._draw_instances_bbox(
                         pose_2d_data, det_data_sample.pred_instances)
         if scores_2d is not None and convert_keypoint:
-            if scores_2d.ndim == 2:
-                scores_2d = scores_2d[..., None]
-            scores_2d = np.squeeze(
-                convert_keypoint_definition(scores_2d, dataset_2d, dataset_3d),
-                axis=-1)
+            if scores_2d.ndim == 3:
+                scores_2d = np.squeeze(scores_2d, axis=-1)
+            scores_2d = scores_2d @ self._get_kpt_convert_matrix(
+                scores_2d.shape[1], dataset_2d, dataset_3d).T
         pose3d_data_dic = self._draw_3d_data_samples(
             data_sample,
             track_ids,
@@ -9,6 +9,13 @@ from mmengine.dist import master_only
 from mmengine.visualization import Visualizer
 
 
+def _is_color_list(colors) -> bool:
+    """Whether ``colors`` is a list with one color per shape, rather than a
+    single color given as a list such as ``[255, 128, 0]``."""
+    return isinstance(colors, list) and (len(colors) == 0 or isinstance(
+        colors[0], (str, tuple, list, np.ndarray)))
+
+
 class OpencvBackendVisualizer(Visualizer):
     """Base visualizer with opencv backend support.
 
@@ -128,17 +135,24 @@ class OpencvBackendVisualizer(Visualizer):
                 alpha=alpha,
                 **kwargs)
         elif self.backend == 'opencv':
-            if isinstance(face_colors, str):
-                face_colors = mmcv.color_val(face_colors)[::-1]
-
+            center = np.asarray(center).reshape(-1, 2)
+            radius = np.broadcast_to(
+                np.asarray(radius).reshape(-1), (len(center), ))
+            if not _is_color_list(face_colors):
+                face_colors = [face_colors] * len(center)
+            face_colors = [
+                mmcv.color_val(c)[::-1] if isinstance(c, str) else c
+                for c in face_colors
+            ]
+
+            # all circles are drawn on the same layer so that the image is
+            # only blended once
+            img = self._image if alpha == 1.0 else self._image.copy()
+            for (x, y), r, color in zip(center, radius, face_colors):
+                img = cv2.circle(img, (int(x), int(y)), int(r), color, -1)
             if alpha == 1.0:
-                self._image = cv2.circle(self._image,
-                                         (int(center[0]), int(center[1])),
-                                         int(radius), face_colors, -1)
+                self._image = img
             else:
-                img = cv2.circle(self._image.copy(),
-                                 (int(center[0]), int(center[1])), int(radius),
-                                 face_colors, -1)
                 self._image = cv2.addWeighted(self._image, 1 - alpha, img,
                                               alpha, 0)
         else:
@@ -358,13 +372,18 @@ class OpencvBackendVisualizer(Visualizer):
                 **kwargs)
 
         elif self.backend == 'opencv':
-            if isinstance(colors, str):
-                colors = mmcv.color_val(colors)[::-1]
-            self._image = cv2.line(
-                self._image, (x_datas[0], y_datas[0]),
-                (x_datas[1], y_datas[1]),
-                colors,
-                thickness=line_widths)
+            x_datas = np.asarray(x_datas).reshape(-1, 2)
+            y_datas = np.asarray(y_datas).reshape(-1, 2)
+            if not _is_color_list(colors):
+                colors = [colors] * len(x_datas)
+            for x, y, color in zip(x_datas, y_datas, colors):
+                if isinstance(color, str):
+                    color = mmcv.color_val(color)[::-1]
+                self._image = cv2.line(
+                    self._image, (int(x[0]), int(y[0])),
+                    (int(x[1]), int(y[1])),
+                    color,
+                    thickness=line_widths)
         else:
             raise ValueError(f'got unsupported backend {self.backend}')
 
@@ -0,0 +1,154 @@
+# Copyright (c) OpenMMLab. All rights reserved.
+from unittest import TestCase
+
+import numpy as np
+from mmengine.structures import InstanceData
+
+from mmpose.apis import convert_keypoint_definition
+from mmpose.structures import PoseDataSample
+from mmpose.visualization import Pose3dLocalVisualizer
+from mmpose.visualization.local_visualizer_3d import (_get_view_rotation,
+                                                      _project_points)
+
+
+class TestPose3dLocalVisualizer(TestCase):
+
+    def setUp(self):
+        self.visualizer = Pose3dLocalVisualizer()
+
+    def _get_dataset_meta(self):
+        # None: kpt or link is hidden
+        pose_kpt_color = [None] + [(127, 127, 127)] * 2 + ['red']
+        pose_link_color = [(127, 127, 127)] * 2 + [None]
+        skeleton_links = [[0, 1], [1, 2], [2, 3]]
+        return {
+            'keypoint_colors': pose_kpt_color,
+            'skeleton_link_colors': pose_link_color,
+            'skeleton_links': skeleton_links
+        }
+
+    def _get_data_samples(self, num_instances):
+        pred_instances = InstanceData()
+        pred_instances.keypoints = np.tile(
+            np.array([[0, 0, 0], [0, 0, 0.5], [0.2, 0, 1], [-0.2, 0, 1]],
+                     dtype=np.float32), (num_instances, 1, 1))
+        pred_instances.keypoint_scores = np.ones((num_instances, 4),
+                                                 dtype=np.float32)
+        data_sample = PoseDataSample()
+        data_sample.pred_instances = pred_instances
+
+        det_instances = InstanceData()
+        det_instances.keypoints = np.tile(
+            np.array([[10, 10], [20, 20], [40, 40], [80, 80]],
+                     dtype=np.float32), (num_instances, 1, 1))
+        det_instances.keypoint_scores = np.ones((num_instances, 4),
+                                                dtype=np.float32)
+        det_data_sample = PoseDataSample()
+        det_data_sample.pred_instances = det_instances
+        return data_sample, det_data_sample
+
+    def test_reassign_det_kpt_color(self):
+        self.visualizer.set_dataset_meta(self._get_dataset_meta())
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        data_sample, det_data_sample = self._get_data_samples(1)
+
+        self.visualizer.det_kpt_color = 'red'
+        drawn_2d, _ = self.visualizer.add_datasample(
+            image,
+            data_sample,
+            det_data_sample,
+            track_ids=[0],
+            convert_keypoint=False)
+        self.assertTupleEqual(tuple(drawn_2d[80, 80]), (0, 0, 204))
+
+        # assigning the colors directly takes effect on the next draw
+        self.visualizer.det_kpt_color = 'blue'
+        drawn_2d, _ = self.visualizer.add_datasample(
+            image,
+            data_sample,
+            det_data_sample,
+            track_ids=[0],
+            convert_keypoint=False)
+        self.assertTupleEqual(tuple(drawn_2d[80, 80]), (204, 0, 0))
+
+        self.visualizer.det_kpt_color = None
+        self.visualizer.kpt_color = 'green'
+        drawn_2d, _ = self.visualizer.add_datasample(
+            image,
+            data_sample,
+            det_data_sample,
+            track_ids=[0],
+            convert_keypoint=False)
+        self.assertTupleEqual(tuple(drawn_2d[80, 80]), (0, 204, 0))
+
+    def test_add_datasample(self):
+        self.visualizer.set_dataset_meta(self._get_dataset_meta())
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        data_sample, det_data_sample = self._get_data_samples(3)
+        # the second instance is skipped for its low scores and the third
+        # one is not tracked
+        data_sample.pred_instances.keypoint_scores[1] = 0.1
+
+        drawn_2d, drawn_3d = self.visualizer.add_datasample(
+            image,
+            data_sample,
+            det_data_sample,
+            track_ids=[3, 7, -1],
+            convert_keypoint=False,
+            num_instances=4,
+            plot_size=200)
+        self.assertTupleEqual(drawn_2d.shape, (100, 100, 3))
+        self.assertFalse(image.any())
+        # the missing plots are padded with "NO DATA" plots
+        self.assertListEqual(sorted(drawn_3d), [-3, -2, 3, 7])
+        for plot in drawn_3d.values():
+            self.assertTupleEqual(plot.shape, (200, 200, 3))
+            self.assertEqual(plot.dtype, np.uint8)
+            self.assertTrue(plot.flags.writeable)
+        self.assertFalse((drawn_3d[3] == drawn_3d[7]).all())
+
+    def test_add_datasample_longer_2d_scores(self):
+        self.visualizer.set_dataset_meta(self._get_dataset_meta())
+        self.visualizer.det_kpt_color = 'red'
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        data_sample, det_data_sample = self._get_data_samples(1)
+        # the 2d keypoints follow a larger layout than the 3d skeleton
+        det_instances = det_data_sample.pred_instances
+        det_instances.keypoints = np.concatenate(
+            [det_instances.keypoints,
+             np.full((1, 2, 2), 50, dtype=np.float32)], axis=1)
+        det_instances.keypoint_scores = np.ones((1, 6), dtype=np.float32)
+
+        _, drawn_3d = self.visualizer.add_datasample(
+            image,
+            data_sample,
+            det_data_sample,
+            track_ids=[0],
+            convert_keypoint=False,
+            num_instances=1)
+        self.assertListEqual(list(drawn_3d), [0])
+
+    def test_project_points(self):
+        # the y axis points right and the z axis up when looking along the
+        # x axis
+        view_rot = _get_view_rotation(0, 0)
+        points = np.array([[0, 1, 2], [1, 0, 0]])
+        pixels, depth = _project_points(points, view_rot, 10,
+                                        np.array([50, 50]))
+        self.assertListEqual(pixels, [(60, 30), (50, 50)])
+        np.testing.assert_allclose(depth, [0, 1], atol=1e-6)
+
+    def test_get_kpt_convert_matrix(self):
+        rng = np.random.default_rng(0)
+        for dataset_2d, num_kpts in [('coco', 17), ('posetrack18', 17),
+                                     ('aic', 14), ('crowdpose', 14),
+                                     ('h36m', 17), ('coco_wholebody', 133)]:
+            with self.subTest(dataset_2d=dataset_2d):
+                scores = rng.random((3, num_kpts)).astype(np.float32)
+                matrix = self.visualizer._get_kpt_convert_matrix(
+                    num_kpts, dataset_2d, 'h36m')
+                expected = np.squeeze(
+                    convert_keypoint_definition(scores[..., None],
+                                                dataset_2d, 'h36m'), -1)
+                np.testing.assert_allclose(
+                    scores @ matrix.T, expected, atol=1e-6)
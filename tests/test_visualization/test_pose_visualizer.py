@@ -97,6 +97,36 @@ class TestPoseLocalVisualizer(TestCase):
             out_file=out_file)
         self._assert_image_and_shape(out_file, ((h * 2), (w * 2), 3))
 
+    def test_draw_multiple_circles_and_lines(self):
+        self.visualizer.set_image(np.zeros((20, 20, 3), dtype=np.uint8))
+        self.visualizer.draw_circles(
+            np.array([[5, 5], [15, 15]]),
+            radius=np.array([2, 2]),
+            face_colors=[(255, 0, 0), 'green'])
+        self.visualizer.draw_lines(
+            np.array([[0, 19], [0, 19]]),
+            np.array([[10, 10], [19, 19]]), [(0, 0, 255), (0, 0, 255)],
+            line_widths=1)
+        drawn_img = self.visualizer.get_image()
+        self.assertTupleEqual(tuple(drawn_img[5, 5]), (255, 0, 0))
+        self.assertTupleEqual(tuple(drawn_img[15, 15]), (0, 255, 0))
+        self.assertTupleEqual(tuple(drawn_img[10, 3]), (0, 0, 255))
+        self.assertTupleEqual(tuple(drawn_img[19, 3]), (0, 0, 255))
+
+        # a single color given as a list is used for all the shapes
+        self.visualizer.set_image(np.zeros((20, 20, 3), dtype=np.uint8))
+        self.visualizer.draw_circles(
+            np.array([[5, 5], [15, 15]]),
+            radius=np.array([2, 2]),
+            face_colors=[255, 128, 0])
+        self.visualizer.draw_lines(
+            np.array([[0, 19]]), np.array([[10, 10]]), [255, 128, 0],
+            line_widths=1)
+        drawn_img = self.visualizer.get_image()
+        self.assertTupleEqual(tuple(drawn_img[5, 5]), (255, 128, 0))
+        self.assertTupleEqual(tuple(drawn_img[15, 15]), (255, 128, 0))
+        self.assertTupleEqual(tuple(drawn_img[10, 3]), (255, 128, 0))
+
     def test_simcc_visualization(self):
         img = np.zeros((512, 512, 3), dtype=np.uint8)
         heatmap = torch.randn([17, 512, 512])